@@ -16,30 +16,29 @@ def main():
         return
 
     print("Initializing client...")
-    client = SplunkSOARClient(base_url=SOAR_URL, auth_token=AUTH_TOKEN, verify=False)
-
-    try:
-        # --- Run a Playbook ---
-        print(f"\n--- Running playbook '{PLAYBOOK_ID_TO_RUN}' on container {CONTAINER_ID_TO_RUN_ON} ---")
-        playbook_run_data = {
-            "container_id": CONTAINER_ID_TO_RUN_ON,
-            "playbook_id": PLAYBOOK_ID_TO_RUN,
-            "scope": "all",
-            "run": True
-        }
-        run_response = client.run_playbook(**playbook_run_data)
-        playbook_run_id = run_response['playbook_run_id']
-        print(f"Playbook queued to run. Run ID: {playbook_run_id}")
-
-        # --- Check Playbook Run Status ---
-        print(f"\n--- Checking status of playbook run {playbook_run_id} ---")
-        # In a real scenario, you would poll this endpoint until status is 'success' or 'failed'
-        status_response = client.get_playbook_run(playbook_run_id)
-        print(f"Status: {status_response['status']}")
-        print(f"Message: {status_response.get('message', 'No message yet.')}")
-
-    except SplunkSOARError as e:
-        print(f"Error: {e}")
+    with SplunkSOARClient(base_url=SOAR_URL, auth_token=AUTH_TOKEN, verify=False) as client:
+        try:
+            # --- Run a Playbook ---
+            print(f"\n--- Running playbook '{PLAYBOOK_ID_TO_RUN}' on container {CONTAINER_ID_TO_RUN_ON} ---")
+            playbook_run_data = {
+                "container_id": CONTAINER_ID_TO_RUN_ON,
+                "playbook_id": PLAYBOOK_ID_TO_RUN,
+                "scope": "all",
+                "run": True
+            }
+            run_response = client.run_playbook(**playbook_run_data)
+            playbook_run_id = run_response['playbook_run_id']
+            print(f"Playbook queued to run. Run ID: {playbook_run_id}")
+
+            # --- Wait for the Playbook Run to Finish ---
+            print(f"\n--- Waiting for playbook run {playbook_run_id} to finish ---")
+            # Polls with exponential backoff instead of hammering the endpoint at a fixed rate
+            status_response = client.wait_for_playbook_run(playbook_run_id, timeout=300)
+            print(f"Status: {status_response['status']}")
+            print(f"Message: {status_response.get('message', 'No message yet.')}")
+
+        except (SplunkSOARError, TimeoutError) as e:
+            print(f"Error: {e}")
 
 if __name__ == "__main__":
     main()
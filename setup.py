@@ -15,7 +15,13 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     install_requires=[
         "requests>=2.20.0",
+        "urllib3>=1.26.0",
     ],
+    extras_require={
+        "stream": ["ijson>=3.1"],
+        "fast": ["orjson>=3"],
+        "http2": ["httpx[http2]>=0.23"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -3,7 +3,287 @@
 import requests
 import json
 import base64
-import warnings
+import importlib
+import importlib.util
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+DEFAULT_POOL_MAXSIZE = 64
+_JSON_HEADERS = {"Content-Type": "application/json"}
+TERMINAL_RUN_STATUSES = frozenset(["success", "failed", "canceled", "cancelled"])
+# Retry policy shared by the requests adapter and the httpx shim.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = frozenset([429, 502, 503, 504])
+_RETRY_METHODS = frozenset(["GET", "HEAD", "DELETE"])
+# Seconds the best-effort warmup HEAD may wait per attempt before giving up.
+WARMUP_TIMEOUT = 2
+
+def _has_module(name):
+    return importlib.util.find_spec(name) is not None
+
+def _import_optional(name, extra):
+    """Imports an optional dependency on first use so it never slows down `import splunk_soar_rest`."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(f"This feature requires {name}; install splunk-soar-rest[{extra}].") from None
+
+def _mount_adapter(session, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """Mounts a pooled HTTPAdapter that retries transient failures with backoff.
+
+    Only gateway/throttling statuses are retried: a 500 from SOAR is usually a real
+    error that would fail again. POST is left out because creates are not idempotent.
+    Once retries are exhausted the last response is returned so that
+    _handle_response can raise SplunkSOARError as usual.
+    """
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+class _Base64FileBody:
+    """A JSON request body whose `field` is the base64 of a file, encoded from disk as it is sent.
+
+    Reads are a multiple of 3 bytes so no padding appears mid-stream, and the exact
+    Content-Length is known up front, so only one chunk is ever held in memory.
+    The file is only opened while the body is being sent, so a request that fails
+    before sending never leaves a handle behind.
+    """
+    _PLACEHOLDER = "__splunk_soar_rest_file__"
+
+    def __init__(self, path, payload, field, chunk_size=57 * 1024 * 3):
+        prefix, suffix = json.dumps({**payload, field: self._PLACEHOLDER}).split(self._PLACEHOLDER)
+        self._prefix = prefix.encode("utf-8")
+        self._suffix = suffix.encode("utf-8")
+        self._chunk_size = chunk_size
+        self._path = path
+        size = os.stat(path).st_size
+        self._length = len(self._prefix) + 4 * ((size + 2) // 3) + len(self._suffix)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        yield self._prefix
+        # Read into one reusable buffer; only the encoded output is allocated per chunk.
+        buffer = bytearray(self._chunk_size)
+        view = memoryview(buffer)
+        with open(self._path, 'rb') as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                yield base64.b64encode(view[:n])
+        yield self._suffix
+
+def _iter_json_array(items, chunk_size=65536):
+    """Serializes an iterable as a JSON array, yielding roughly chunk_size bytes at a time."""
+    buffer = bytearray(b"[")
+    separator = b""
+    for item in items:
+        buffer += separator
+        buffer += _json_dumps(item)
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+class _HTTPXResponse:
+    """Exposes the parts of the requests.Response API the client relies on for an httpx.Response."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.url = response.url
+        self.headers = response.headers
+        self.ok = response.status_code < 400
+        self.raw = self
+        self.decode_content = True
+        self._chunks = None
+
+    @property
+    def content(self):
+        return self._response.read()
+
+    @property
+    def text(self):
+        self._response.read()
+        return self._response.text
+
+    def iter_content(self, chunk_size=None):
+        return self._response.iter_bytes(chunk_size)
+
+    def read(self, size=-1):
+        """File-like access to the decoded body of a streamed response, as used by ijson."""
+        if size == 0:
+            return b""
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(size if size > 0 else None)
+        return next(self._chunks, b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._response.close()
+
+class _HTTPXSession:
+    """A requests.Session look-alike backed by an HTTP/2-capable httpx.Client.
+
+    httpx only retries failed connections, so GET, HEAD and DELETE answered with a
+    throttling or gateway status are retried here with the same policy as _mount_adapter.
+    """
+
+    def __init__(self, verify=True, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+        httpx = _import_optional("httpx", "http2")
+        self.verify = verify
+        limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        self._client = httpx.Client(transport=httpx.HTTPTransport(http2=True, verify=verify, limits=limits, retries=3))
+
+    @property
+    def headers(self):
+        return self._client.headers
+
+    @property
+    def auth(self):
+        return self._client.auth
+
+    @auth.setter
+    def auth(self, value):
+        self._client.auth = value
+
+    def _send(self, request, **kwargs):
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = self._client.send(request, **kwargs)
+            if (attempt == _RETRY_TOTAL or request.method not in _RETRY_METHODS
+                    or response.status_code not in _RETRY_STATUSES):
+                return _HTTPXResponse(response)
+            response.close()
+            # Like urllib3: honour a numeric Retry-After, else retry at once, then back off exponentially.
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = _RETRY_BACKOFF * 2 ** attempt if attempt else 0
+            time.sleep(delay)
+
+    def get(self, url, params=None, stream=False, headers=None):
+        return self._send(self._client.build_request("GET", url, params=params, headers=headers), stream=stream)
+
+    def post(self, url, data=None, headers=None):
+        headers = dict(headers or {})
+        if data is not None and not isinstance(data, bytes) and hasattr(data, "__len__"):
+            headers["Content-Length"] = str(len(data))
+        return _HTTPXResponse(self._client.post(url, content=data, headers=headers))
+
+    def delete(self, url):
+        return self._send(self._client.build_request("DELETE", url))
+
+    def head(self, url, allow_redirects=False, timeout=None):
+        # httpx reads timeout=None as "no timeout", so only pass it when one is given.
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        return self._send(self._client.build_request("HEAD", url, **kwargs), follow_redirects=allow_redirects)
+
+    def close(self):
+        self._client.close()
+
+_shared_sessions = {}
+_shared_sessions_lock = threading.Lock()
+
+def _acquire_shared_session(key, pool_maxsize):
+    """Returns the process-wide session for key, creating it on first use, and counts the new owner."""
+    with _shared_sessions_lock:
+        entry = _shared_sessions.get(key)
+        if entry is None:
+            session = requests.Session()
+            _mount_adapter(session, pool_maxsize)
+            entry = _shared_sessions[key] = [session, 0]
+        entry[1] += 1
+        return entry[0]
+
+def _release_shared_session(key):
+    """Drops one owner of a shared session and closes it once the last owner is gone."""
+    with _shared_sessions_lock:
+        entry = _shared_sessions[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _shared_sessions[key]
+            entry[0].close()
+
+_MISSING = object()
+
+# Writes to these resources also change what other cached endpoints return.
+_CACHE_DEPENDENTS = {"system_settings": ("system_info",)}
+
+class _TTLCache:
+    """A small thread-safe cache whose entries expire ttl seconds after they are stored.
+
+    Keys are (endpoint, params) tuples so that a write can drop everything cached
+    under the same resource, e.g. "role/5" invalidates "role" and "role/7".
+    """
+
+    def __init__(self, maxsize=512, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, resource):
+        with self._lock:
+            for key in [k for k in self._data if k[0].split("/", 1)[0] == resource]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
 
 class SplunkSOARError(Exception):
     """Custom exception for Splunk SOAR API errors."""
@@ -18,7 +298,9 @@ class SplunkSOARError(Exception):
 class SplunkSOARClient:
     """A Python client for the Splunk SOAR REST API."""
 
-    def __init__(self, base_url, username=None, password=None, auth_token=None, verify=True):
+    def __init__(self, base_url, username=None, password=None, auth_token=None, verify=True,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, session=None, transport="requests", cache_ttl=60,
+                 warmup=False, share_session=False):
         """
         Initializes the Splunk SOAR Client.
 
@@ -28,66 +310,319 @@ class SplunkSOARClient:
             password (str, optional): Password for basic authentication.
             auth_token (str, optional): Automation token for ph-auth-token header authentication.
             verify (bool, optional): Whether to verify SSL certificates. Defaults to True.
+                Passing False silences urllib3's InsecureRequestWarning for the whole process.
+            pool_maxsize (int, optional): Maximum number of pooled connections kept open to the instance.
+                Ignored when a session is passed in.
+            session (requests.Session, optional): An existing session to reuse. The client sets its
+                credentials and verify flag on it, so only pass a session dedicated to this instance and
+                credentials; use share_session to pool connections across clients. The caller remains
+                responsible for closing it.
+            transport (str, optional): "requests" (default) or "httpx" to multiplex calls over a single
+                HTTP/2 connection. The httpx transport needs the "http2" extra and ignores session.
+            cache_ttl (int, optional): Seconds to cache rarely-changing reads such as get_version. 0 disables caching.
+            warmup (bool, optional): Open and authenticate the first pooled connection immediately with a
+                HEAD request, so the TLS handshake is not paid by the first real call. Failures are ignored.
+            share_session (bool, optional): Reuse one pooled session across every client in the process
+                with the same base_url, credentials, verify flag and pool_maxsize, so short-lived clients
+                keep warm connections. The session is closed when the last client sharing it is closed.
         """
         if not base_url:
             raise ValueError("base_url must be provided.")
         
         self.base_url = base_url.rstrip('/')
+        self._rest_prefix = self.base_url + "/rest/"
         self.verify = verify
+        self.pool_maxsize = pool_maxsize
         
-        self.session = requests.Session()
+        if not auth_token and not (username and password):
+            raise ValueError("Either auth_token or username/password must be provided.")
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport {transport!r}; expected 'requests' or 'httpx'.")
+        if share_session and (session is not None or transport != "requests"):
+            raise ValueError("share_session cannot be combined with an explicit session or the httpx transport.")
+
+        self._owns_session = session is None or transport == "httpx"
+        self._shared_key = None
+        if transport == "httpx":
+            session = _HTTPXSession(verify, pool_maxsize)
+        elif share_session:
+            self._owns_session = False
+            self._shared_key = (self.base_url, auth_token or (username, password), verify, pool_maxsize)
+            session = _acquire_shared_session(self._shared_key, pool_maxsize)
+        elif session is None:
+            session = requests.Session()
+            _mount_adapter(session, pool_maxsize)
+        self.session = session
         self.session.verify = self.verify
+        self._cache = _TTLCache(ttl=cache_ttl)
         
         if auth_token:
             self.session.headers.update({"ph-auth-token": auth_token})
-        elif username and password:
-            self.session.auth = (username, password)
         else:
-            raise ValueError("Either auth_token or username/password must be provided.")
+            self.session.auth = (username, password)
 
         if not self.verify:
-            warnings.filterwarnings("ignore", "Unverified HTTPS request")
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        if warmup:
+            self.warmup()
+
+    def warmup(self):
+        """Establishes a pooled connection to the instance ahead of the first API call.
+
+        Best effort: each attempt is bounded by WARMUP_TIMEOUT and any error is swallowed, so the
+        connection is simply opened on first use instead.
+        """
+        try:
+            self.session.head(self._rest_prefix + "version", allow_redirects=False, timeout=WARMUP_TIMEOUT)
+        except Exception:
+            pass
+
+    @property
+    def session(self):
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        # Bind the request methods once; the per-call paths use these instead of self.session.get etc.
+        self._session = session
+        self._sget = session.get
+        self._spost = session.post
+        self._sdelete = session.delete
+
+    def close(self):
+        """Closes the underlying session and its pooled connections, unless it was passed in.
+
+        A shared session is only closed when the last client using it is closed.
+        """
+        if self._shared_key is not None:
+            _release_shared_session(self._shared_key)
+            self._shared_key = None
+        elif self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _build_url(self, endpoint):
-        return f"{self.base_url}/rest/{endpoint}"
+        # _get, _post_body and _delete inline this concatenation to save a call per request.
+        return self._rest_prefix + endpoint
 
     def _handle_response(self, response):
         """Checks response status and returns JSON or raises an error."""
-        if response.ok:
-            try:
-                if response.status_code == 204: return None
-                return response.json()
-            except json.JSONDecodeError:
-                return response.content
-        else:
-            raise SplunkSOARError(f"API call to {response.url} failed", response.status_code, response.text)
+        status = response.status_code
+        if status == 204:
+            return None
+        if status >= 400:
+            raise SplunkSOARError(f"API call to {response.url} failed", status, response.text)
+        return self._decode(response.content)
+
+    @staticmethod
+    def _decode(content):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            return content
 
     def _get(self, endpoint, params=None):
-        return self._handle_response(self.session.get(self._build_url(endpoint), params=params))
+        if params is None:
+            return self._handle_response(self._sget(self._rest_prefix + endpoint))
+        return self._handle_response(self._sget(self._rest_prefix + endpoint, params=params))
+
+    def _get_cached(self, endpoint, params=None):
+        """GETs an endpoint that rarely changes, serving repeats from the TTL cache.
+
+        Writes through this client invalidate the affected resource. The raw body is cached and
+        decoded on every hit, so each caller gets its own object to mutate.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+        if not self._cache.ttl or key is None:
+            return self._get(endpoint, params=params)
+        content = self._cache.get(key)
+        if content is not _MISSING:
+            return self._decode(content)
+        if params is None:
+            response = self._sget(self._rest_prefix + endpoint)
+        else:
+            response = self._sget(self._rest_prefix + endpoint, params=params)
+        value = self._handle_response(response)
+        if response.status_code != 204:
+            self._cache.set(key, response.content)
+        return value
+
+    def _invalidate(self, endpoint):
+        resource = endpoint.split("/", 1)[0]
+        self._cache.invalidate(resource)
+        for dependent in _CACHE_DEPENDENTS.get(resource, ()):
+            self._cache.invalidate(dependent)
+
+    def invalidate_cache(self):
+        """Drops every cached response so the next read goes to the server."""
+        self._cache.clear()
 
     def _post(self, endpoint, json_data=None):
-        return self._handle_response(self.session.post(self._build_url(endpoint), json=json_data))
+        return self._post_body(endpoint, None if json_data is None else _json_dumps(json_data))
+
+    def _post_body(self, endpoint, body):
+        """Posts an already-serialized JSON body (bytes or a streaming body object)."""
+        self._invalidate(endpoint)
+        return self._handle_response(self._spost(self._rest_prefix + endpoint, data=body, headers=_JSON_HEADERS))
+
+    def _post_streaming(self, endpoint, items):
+        """Posts an iterable as a JSON array that is serialized while it is being sent (chunked transfer)."""
+        return self._post_body(endpoint, _iter_json_array(items))
 
     def _delete(self, endpoint):
-        return self._handle_response(self.session.delete(self._build_url(endpoint)))
+        self._invalidate(endpoint)
+        response = self._sdelete(self._rest_prefix + endpoint)
+        # Deletes usually answer 204 or an empty 200; don't attempt to decode those.
+        if response.status_code == 204 or (response.ok and not response.content):
+            return None
+        return self._handle_response(response)
+
+    def _wait_for_run(self, fetch, run_id, timeout, initial_interval, max_interval):
+        """Polls fetch(run_id) with exponential backoff until the run reaches a terminal status."""
+        if initial_interval <= 0 or max_interval <= 0:
+            raise ValueError("initial_interval and max_interval must be positive.")
+        delay = initial_interval
+        deadline = time.monotonic() + timeout
+        while True:
+            run = fetch(run_id)
+            if run.get("status") in TERMINAL_RUN_STATUSES:
+                return run
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Run {run_id} did not finish within {timeout} seconds (last status: {run.get('status')})")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_interval)
+
+    def _map_concurrently(self, func, items, max_workers):
+        """Applies func to items on a thread pool no larger than the connection pool, keeping input order."""
+        with ThreadPoolExecutor(max_workers=min(max_workers, self.pool_maxsize)) as executor:
+            return list(executor.map(func, items))
+
+    def _iter_items(self, endpoint, params=None, prefix="data.item"):
+        return self._stream_items(self._build_url(endpoint), params=params, prefix=prefix)
+
+    def _stream_items(self, url, params=None, prefix="data.item", page_info=None):
+        """Yields the records of a list response one at a time as they are parsed off the socket.
+
+        When page_info is a dict, the top-level num_pages of the response is stored in it.
+        """
+        ijson = _import_optional("ijson", "stream")
+        with self._sget(url, params=params, stream=True) as response:
+            if not response.ok:
+                raise SplunkSOARError(f"API call to {response.url} failed", response.status_code, response.text)
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            for current, event, value in events:
+                if current == prefix:
+                    if event not in ("start_map", "start_array"):
+                        yield value
+                        continue
+                    # Feed the record's events to a builder until its closing event.
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    depth = 1
+                    for current, event, value in events:
+                        if event in ("start_map", "start_array"):
+                            depth += 1
+                        elif event in ("end_map", "end_array"):
+                            depth -= 1
+                            if not depth:
+                                break
+                        builder.event(event, value)
+                    yield builder.value
+                elif current == "num_pages" and page_info is not None:
+                    page_info["num_pages"] = value
 
     # --- Generic Querying (p.11) ---
     def query(self, endpoint, params=None):
         """Generic GET method for any endpoint."""
         return self._get(endpoint, params=params)
 
+    def bulk(self, calls, max_workers=None, return_exceptions=False):
+        """Runs independent calls concurrently over the pooled session and returns their results in order.
+
+        Each call is a (method, endpoint, payload) tuple where method is "get", "post" or "delete";
+        payload is the query params for GET, the JSON body for POST and ignored for DELETE.
+        With return_exceptions=True a failing call yields its SplunkSOARError in place
+        of a result instead of raising. Every method is checked before any call is sent,
+        so an unsupported one raises ValueError without side effects.
+        """
+        calls = list(calls)
+        for method, _, _ in calls:
+            if method not in ("get", "post", "delete"):
+                raise ValueError(f"Unsupported method {method!r}; expected 'get', 'post' or 'delete'.")
+
+        def run(call):
+            method, endpoint, payload = call
+            try:
+                if method == "get":
+                    return self._get(endpoint, params=payload)
+                if method == "post":
+                    return self._post(endpoint, json_data=payload)
+                return self._delete(endpoint)
+            except SplunkSOARError as e:
+                if return_exceptions:
+                    return e
+                raise
+        return self._map_concurrently(run, calls, max_workers or self.pool_maxsize)
+
+    def paginate(self, endpoint, params=None, page_size=1000, key="data", stream=False):
+        """Yields every record of a list endpoint, fetching page_size records per request.
+
+        Records are read from the `key` list of each page. Paging follows num_pages and only
+        falls back to stopping at the first short page when a response omits it. With
+        stream=True each page is parsed incrementally with ijson.
+        """
+        # Match requests, which leaves out None-valued params, and accept a page given as a string.
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        page = int(params.pop("page", 0))
+        params["page_size"] = page_size
+        # Only the page number changes between requests, so encode everything else once.
+        page_url = self._build_url(endpoint) + "?" + urlencode(params, doseq=True) + "&page="
+        while True:
+            url = page_url + str(page)
+            if stream:
+                count = 0
+                page_info = {}
+                for item in self._stream_items(url, prefix=f"{key}.item", page_info=page_info):
+                    count += 1
+                    yield item
+                num_pages = page_info.get("num_pages")
+            else:
+                response = self._handle_response(self._sget(url))
+                records = response.get(key, [])
+                count = len(records)
+                yield from records
+                num_pages = response.get("num_pages")
+            if num_pages is not None:
+                if page + 1 >= num_pages:
+                    return
+            elif not page_size or count < page_size:
+                return
+            page += 1
+
     # --- System Info Endpoints (p.19) ---
     def get_version(self):
         """Gets the Splunk SOAR product version."""
-        return self._get("version")
+        return self._get_cached("version")
 
     def get_system_info(self):
         """Gets the system timezone and base URL."""
-        return self._get("system_info")
+        return self._get_cached("system_info")
 
     def get_license(self):
         """Gets license configuration and usage."""
-        return self._get("license")
+        return self._get_cached("license")
 
     def upload_license(self, license_string):
         """Automates loading a Splunk SOAR license."""
@@ -95,7 +630,7 @@ class SplunkSOARClient:
 
     # --- Administration Endpoints (p.55) ---
     def get_indicator_cef_filters(self, params=None):
-        return self._get("indicator_cef_filter", params=params)
+        return self._get_cached("indicator_cef_filter", params=params)
 
     def update_indicator_cef_filter(self, filter_id, apply_filter):
         return self._post(f"indicator_cef_filter/{filter_id}", json_data={"apply_filter": apply_filter})
@@ -105,23 +640,50 @@ class SplunkSOARClient:
         return self._get("app", params=params)
     
     def get_app(self, app_id):
-        return self._get(f"app/{app_id}")
+        return self._get_cached(f"app/{app_id}")
 
     def install_app_from_path(self, app_path):
-        """Installs an app from a local file path."""
-        with open(app_path, 'rb') as f:
-            encoded_contents = base64.b64encode(f.read()).decode('utf-8')
-        return self._post("app", json_data={"app": encoded_contents})
+        """Installs an app from a local file path, streaming the base64-encoded tarball from disk."""
+        return self._post_body("app", _Base64FileBody(app_path, {}, "app"))
 
     def delete_app(self, app_id):
         return self._delete(f"app/{app_id}")
 
     # --- Artifact Endpoints (p.72) ---
-    def get_artifacts(self, params=None):
+    def get_artifacts(self, params=None, stream=False):
+        """Lists artifacts. With stream=True, returns an iterator that parses records off the socket one at a time."""
+        if stream:
+            return self._iter_items("artifact", params=params)
         return self._get("artifact", params=params)
 
+    def iter_artifacts(self, params=None, page_size=500):
+        """Yields every matching artifact, walking all pages; each page is parsed incrementally when ijson is installed."""
+        return self.paginate("artifact", params, page_size=page_size, stream=_has_module("ijson"))
+
     def create_artifact(self, **kwargs):
         return self._post("artifact", json_data=kwargs)
+
+    def create_artifacts(self, artifacts):
+        """Creates several artifacts in a single request by posting them as a JSON list.
+
+        Lists and tuples are serialized up front; any other iterable (e.g. a generator) is
+        serialized while the request body is streamed, so the batch is never held in memory.
+        The server validates the batch as a whole, so one bad record rejects all of them;
+        use create_artifacts_bulk when records must succeed or fail independently.
+        """
+        if isinstance(artifacts, (list, tuple)):
+            return self._post("artifact", json_data=list(artifacts))
+        return self._post_streaming("artifact", artifacts)
+
+    def create_artifacts_bulk(self, artifacts, max_workers=8):
+        """Creates artifacts concurrently, one POST per artifact, over the pooled session.
+
+        Returns the responses in the same order as the input. max_workers is capped at
+        the connection pool size so that no request waits on a fresh connection.
+        Prefer create_artifacts, which sends all records in one request, unless each
+        artifact needs its own success or failure.
+        """
+        return self._map_concurrently(lambda artifact: self.create_artifact(**artifact), artifacts, max_workers)
         
     def get_artifact(self, artifact_id):
         return self._get(f"artifact/{artifact_id}")
@@ -146,9 +708,16 @@ class SplunkSOARClient:
         return self._delete(f"asset/{asset_id}")
 
     # --- Audit Endpoints (p.82) ---
-    def get_audit_events(self, params=None):
+    def get_audit_events(self, params=None, stream=False):
+        """Lists audit events. With stream=True, returns an iterator that parses records off the socket one at a time."""
+        if stream:
+            return self._iter_items("audit", params=params)
         return self._get("audit", params=params)
 
+    def iter_audit_events(self, params=None, page_size=500):
+        """Yields every matching audit event, walking all pages; each page is parsed incrementally when ijson is installed."""
+        return self.paginate("audit", params, page_size=page_size, stream=_has_module("ijson"))
+
     def get_user_audit(self, user_id, params=None):
         return self._get(f"ph_user/{user_id}/audit", params=params)
 
@@ -161,9 +730,21 @@ class SplunkSOARClient:
     def get_container_audit(self, container_id, params=None):
         return self._get(f"container/{container_id}/audit", params=params)
 
+    def get_audit_bulk(self, user_ids=(), role_ids=(), playbook_ids=(), container_ids=(), params=None):
+        """Fetches the audit trail for several users, roles, playbooks and containers in one request.
+
+        Each id list becomes a comma-separated filter on /rest/audit, replacing one
+        get_*_audit call per entity.
+        """
+        audit_params = dict(params or {})
+        for name, ids in (("user", user_ids), ("role", role_ids), ("playbook", playbook_ids), ("container", container_ids)):
+            if ids:
+                audit_params[name] = ",".join(str(i) for i in ids)
+        return self._get("audit", params=audit_params)
+
     # --- CEF Endpoints (p.99) ---
     def get_cefs(self, params=None):
-        return self._get("cef", params=params)
+        return self._get_cached("cef", params=params)
 
     def create_cef(self, name, data_type):
         return self._post("cef", json_data={"name": name, "data_type": data_type})
@@ -175,9 +756,16 @@ class SplunkSOARClient:
         return self._delete(f"cef/{cef_id}")
 
     # --- Container Endpoints (p.105) ---
-    def get_containers(self, params=None):
+    def get_containers(self, params=None, stream=False):
+        """Lists containers. With stream=True, returns an iterator that parses records off the socket one at a time."""
+        if stream:
+            return self._iter_items("container", params=params)
         return self._get("container", params=params)
 
+    def iter_containers(self, params=None, page_size=500):
+        """Yields every matching container, walking all pages; each page is parsed incrementally when ijson is installed."""
+        return self.paginate("container", params, page_size=page_size, stream=_has_module("ijson"))
+
     def create_container(self, **kwargs):
         return self._post("container", json_data=kwargs)
         
@@ -194,10 +782,8 @@ class SplunkSOARClient:
         return self._post("container_comment", json_data={"container_id": container_id, "comment": comment})
         
     def add_container_attachment_from_path(self, container_id, file_path, file_name, metadata=None):
-        with open(file_path, 'rb') as f:
-            file_content = base64.b64encode(f.read()).decode('utf-8')
-        data = {"container_id": container_id, "file_name": file_name, "file_content": file_content, "metadata": metadata or {"contains": ["vault id"]}}
-        return self._post("container_attachment", json_data=data)
+        data = {"container_id": container_id, "file_name": file_name, "metadata": metadata or {"contains": ["vault id"]}}
+        return self._post_body("container_attachment", _Base64FileBody(file_path, data, "file_content"))
 
     # --- Evidence Endpoints (p.130) ---
     def add_evidence(self, container_id, object_id, content_type):
@@ -231,9 +817,24 @@ class SplunkSOARClient:
 
     # --- Playbook Endpoints (p.166) ---
     def get_playbook(self, playbook_id):
-        """Retrieves a specific playbook by its ID as a gzipped file."""
+        """Retrieves a specific playbook by its ID as a gzipped file.
+
+        The whole file is buffered in memory; use download_playbook to stream it to disk instead.
+        """
         return self._get(f"playbook/{playbook_id}")
 
+    def download_playbook(self, playbook_id, fp, chunk_size=65536):
+        """Streams a playbook's gzipped file into a writable binary file object."""
+        with self._sget(self._build_url(f"playbook/{playbook_id}"), stream=True) as response:
+            if not response.ok:
+                raise SplunkSOARError(f"API call to {response.url} failed", response.status_code, response.text)
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fp.write(chunk)
+
+    def import_playbook_from_path(self, playbook_path, scm="local", force=False):
+        """Imports a playbook .tgz from a local file path, streaming the base64-encoded file from disk."""
+        return self._post_body("import_playbook", _Base64FileBody(playbook_path, {"scm": scm, "force": force}, "playbook"))
+
     def run_playbook(self, **kwargs):
         """Runs a playbook against a container."""
         return self._post("playbook_run", json_data=kwargs)
@@ -242,6 +843,13 @@ class SplunkSOARClient:
         """Checks the status of a playbook run."""
         return self._get(f"playbook_run/{run_id}")
 
+    def wait_for_playbook_run(self, run_id, timeout=600, initial_interval=0.5, max_interval=30):
+        """Polls a playbook run with exponential backoff until it succeeds, fails or is canceled.
+
+        Raises TimeoutError if the run is still going after timeout seconds.
+        """
+        return self._wait_for_run(self.get_playbook_run, run_id, timeout, initial_interval, max_interval)
+
     # --- Role Management Endpoints (p.174) ---
     def get_roles(self, params=None):
         return self._get("role", params=params)
@@ -250,7 +858,7 @@ class SplunkSOARClient:
         return self._post("role", json_data=kwargs)
         
     def get_role(self, role_id):
-        return self._get(f"role/{role_id}")
+        return self._get_cached(f"role/{role_id}")
         
     def update_role(self, role_id, **kwargs):
         return self._post(f"role/{role_id}", json_data=kwargs)
@@ -264,6 +872,10 @@ class SplunkSOARClient:
         
     def get_action_run(self, run_id):
         return self._get(f"action_run/{run_id}")
+
+    def wait_for_action_run(self, run_id, timeout=600, initial_interval=0.5, max_interval=30):
+        """Polls an action run with exponential backoff until it reaches a terminal status."""
+        return self._wait_for_run(self.get_action_run, run_id, timeout, initial_interval, max_interval)
         
     def cancel_action_run(self, run_id):
         return self._post(f"action_run/{run_id}", json_data={"cancel": True})
@@ -273,7 +885,7 @@ class SplunkSOARClient:
 
     # --- Severity Endpoints (p.192) ---
     def get_severities(self, params=None):
-        return self._get("severity", params=params)
+        return self._get_cached("severity", params=params)
 
     def create_severity(self, **kwargs):
         return self._post("severity", json_data=kwargs)
@@ -283,7 +895,7 @@ class SplunkSOARClient:
         
     # --- Status Endpoints (p.197) ---
     def get_container_statuses(self, params=None):
-        return self._get("container_status", params=params)
+        return self._get_cached("container_status", params=params)
 
     def create_container_status(self, name, status_type, is_default=False):
         return self._post("container_status", json_data={"name": name, "status_type": status_type, "is_default": is_default})
@@ -338,6 +950,14 @@ class SplunkSOARClient:
         if categories: search_params['categories'] = categories
         if tenant: search_params['tenant'] = tenant
         return self._get("search", params=search_params)
+
+    def iter_search(self, query, categories=None, tenant=None, params=None, page_size=500):
+        """Yields search hits page by page, streaming each page with ijson when it is installed."""
+        search_params = dict(params or {})
+        search_params['query'] = query
+        if categories: search_params['categories'] = categories
+        if tenant: search_params['tenant'] = tenant
+        return self.paginate("search", search_params, page_size=page_size, key="results", stream=_has_module("ijson"))
         
     # --- Vault Endpoints (p.223) ---
     def get_vault_documents(self, params=None):
@@ -361,3 +981,22 @@ class SplunkSOARClient:
         
     def add_task_to_workbook_phase(self, **kwargs):
         return self._post("workbook_task_template", json_data=kwargs)
+
+    def create_workbook_template_tree(self, phases, nested=True, max_workers=8, **kwargs):
+        """Creates a workbook template together with its phases and their tasks.
+
+        phases is a list of phase dicts, each with an optional "tasks" list of task dicts.
+        By default the whole tree is posted to workbook_template in one request. With
+        nested=False (for servers that reject nested phases) the template and phases are
+        created first and all tasks are then created concurrently.
+        """
+        if nested:
+            return self._post("workbook_template", json_data={**kwargs, "phases": phases})
+        template = self.create_workbook_template(**kwargs)
+        tasks = []
+        for phase in phases:
+            phase_data = {k: v for k, v in phase.items() if k != "tasks"}
+            created = self.add_phase_to_workbook(template=template["id"], **phase_data)
+            tasks.extend({**task, "phase": created["id"]} for task in phase.get("tasks", ()))
+        self._map_concurrently(lambda task: self.add_task_to_workbook_phase(**task), tasks, max_workers)
+        return template
@@ -1,7 +1,11 @@
+import base64
+import io
 import os
+import tempfile
 import unittest
 import json
 from unittest.mock import MagicMock, patch
+import splunk_soar_rest
 from splunk_soar_rest import SplunkSOARClient, SplunkSOARError
 
 SOAR_URL = os.getenv("SOAR_URL")
@@ -26,7 +30,7 @@ class TestClientBasics(unittest.TestCase):
         mock_response = MagicMock()
         mock_response.ok = True
         mock_response.status_code = 200
-        mock_response.json.return_value = {"ok": True}
+        mock_response.content = b'{"ok": true}'
         mock_session.get.return_value = mock_response
         mock_session.post.return_value = mock_response
         mock_session.delete.return_value = mock_response
@@ -34,14 +38,102 @@ class TestClientBasics(unittest.TestCase):
 
         client = SplunkSOARClient(base_url="https://soar", auth_token="t")
         self.assertEqual(client._get("foo"), {"ok": True})
-        mock_session.get.assert_called_with("https://soar/rest/foo", params=None)
+        mock_session.get.assert_called_with("https://soar/rest/foo")
+        client._get("foo", params={"page": 2})
+        mock_session.get.assert_called_with("https://soar/rest/foo", params={"page": 2})
 
         self.assertEqual(client._post("bar", json_data={"a":1}), {"ok": True})
-        mock_session.post.assert_called_with("https://soar/rest/bar", json={"a":1})
+        args, kwargs = mock_session.post.call_args
+        self.assertEqual(args[0], "https://soar/rest/bar")
+        self.assertEqual(json.loads(kwargs["data"]), {"a": 1})
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
 
         self.assertEqual(client._delete("baz"), {"ok": True})
         mock_session.delete.assert_called_with("https://soar/rest/baz")
 
+    @patch("splunk_soar_rest.requests.Session")
+    def test_context_manager_closes_session(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        with SplunkSOARClient(base_url="https://soar", auth_token="t") as client:
+            self.assertIs(client.session, mock_session)
+        mock_session.close.assert_called_once_with()
+
+    def test_adapter_mounted_with_pool_size(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t", pool_maxsize=32)
+        adapter = client.session.get_adapter("https://soar/rest/version")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+        self.assertNotIn(500, adapter.max_retries.status_forcelist)
+
+    def test_injected_session_is_not_closed(self):
+        shared = MagicMock(headers={})
+        with SplunkSOARClient(base_url="https://soar", auth_token="t", session=shared) as client:
+            self.assertIs(client.session, shared)
+            self.assertEqual(shared.headers["ph-auth-token"], "t")
+        shared.close.assert_not_called()
+
+    def test_share_session_refcounts(self):
+        first = SplunkSOARClient(base_url="https://shared", auth_token="t", share_session=True)
+        second = SplunkSOARClient(base_url="https://shared/", auth_token="t", share_session=True)
+        other = SplunkSOARClient(base_url="https://shared", auth_token="other", share_session=True)
+        self.assertIs(first.session, second.session)
+        self.assertIsNot(first.session, other.session)
+        first.session.close = MagicMock()
+        first.close()
+        first.session.close.assert_not_called()
+        second.close()
+        first.session.close.assert_called_once_with()
+        other.close()
+        self.assertEqual(splunk_soar_rest._shared_sessions, {})
+
+    @patch("splunk_soar_rest.urllib3.disable_warnings")
+    def test_unverified_disables_insecure_warning(self, mock_disable):
+        SplunkSOARClient(base_url="https://soar", auth_token="t", verify=False)
+        mock_disable.assert_called_once_with(splunk_soar_rest.urllib3.exceptions.InsecureRequestWarning)
+
+    @patch("splunk_soar_rest.requests.Session")
+    def test_warmup(self, mock_session_cls):
+        mock_session = mock_session_cls.return_value
+        SplunkSOARClient(base_url="https://soar", auth_token="t")
+        mock_session.head.assert_not_called()
+        mock_session.head.side_effect = ConnectionError("down")
+        SplunkSOARClient(base_url="https://soar", auth_token="t", warmup=True)
+        mock_session.head.assert_called_once_with("https://soar/rest/version", allow_redirects=False,
+                                                  timeout=splunk_soar_rest.WARMUP_TIMEOUT)
+
+    def test_unknown_transport(self):
+        with self.assertRaises(ValueError):
+            SplunkSOARClient(base_url="https://soar", auth_token="t", transport="curl")
+
+    @unittest.skipIf(not splunk_soar_rest._has_module("httpx"), "httpx is not installed")
+    def test_httpx_transport(self):
+        with SplunkSOARClient(base_url="https://soar", auth_token="t", transport="httpx") as client:
+            self.assertIsInstance(client.session, splunk_soar_rest._HTTPXSession)
+            self.assertEqual(client.session.headers["ph-auth-token"], "t")
+
+    @unittest.skipIf(not splunk_soar_rest._has_module("httpx"), "httpx is not installed")
+    @patch("splunk_soar_rest.time.sleep")
+    def test_httpx_transport_retries_gateway_statuses(self, mock_sleep):
+        import httpx
+        statuses = {"GET": [503, 429, 200], "POST": [503]}
+        def handler(request):
+            return httpx.Response(statuses[request.method].pop(0), headers={"Retry-After": "1"} if request.method == "GET" else {}, json={})
+        with SplunkSOARClient(base_url="https://soar", auth_token="t", transport="httpx") as client:
+            client.session._client = httpx.Client(transport=httpx.MockTransport(handler))
+            self.assertEqual(client.get_container(1), {})
+            self.assertEqual(mock_sleep.call_count, 2)
+            with self.assertRaises(SplunkSOARError):
+                client.create_container(name="c")
+        self.assertEqual(statuses, {"GET": [], "POST": []})
+
+    def test_delete_empty_body_returns_none(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        client.session.delete.return_value = MagicMock(ok=True, status_code=200, content=b"")
+        self.assertIsNone(client.delete_note(2))
+
 class TestHandleResponse(unittest.TestCase):
     def setUp(self):
         self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
@@ -50,7 +142,7 @@ class TestHandleResponse(unittest.TestCase):
         resp = MagicMock()
         resp.ok = True
         resp.status_code = 200
-        resp.json.return_value = {"x": 1}
+        resp.content = b'{"x": 1}'
         self.assertEqual(self.client._handle_response(resp), {"x": 1})
 
     def test_handle_no_content(self):
@@ -63,7 +155,6 @@ class TestHandleResponse(unittest.TestCase):
         resp = MagicMock()
         resp.ok = True
         resp.status_code = 200
-        resp.json.side_effect = json.JSONDecodeError("bad", "", 0)
         resp.content = b"binary"
         self.assertEqual(self.client._handle_response(resp), b"binary")
 
@@ -97,6 +188,327 @@ class TestEndpointWrappers(unittest.TestCase):
         self.client.add_container_comment(1, "c")
         self.client._post.assert_called_with("container_comment", json_data={"container_id": 1, "comment": "c"})
 
+    def test_audit_bulk(self):
+        self.client.get_audit_bulk(user_ids=[1, 2], container_ids=(7,), params={"format": "json"})
+        self.client._get.assert_called_with("audit", params={"format": "json", "user": "1,2", "container": "7"})
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.client.session = MagicMock()
+        response = self.client.session.get.return_value
+        response.ok = True
+        response.status_code = 200
+        response.content = b'{"version": "6.3"}'
+
+    def test_repeat_reads_are_cached(self):
+        self.assertEqual(self.client.get_version(), {"version": "6.3"})
+        self.assertEqual(self.client.get_version(), {"version": "6.3"})
+        self.assertEqual(self.client.session.get.call_count, 1)
+        self.client.invalidate_cache()
+        self.client.get_version()
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_mutating_a_cached_value_does_not_change_the_cache(self):
+        self.client.session.get.return_value.content = b'{"id": 1, "permissions": [1]}'
+        self.client.get_role(1)["permissions"].append(99)
+        self.client.get_role(1)["permissions"].append(98)
+        self.assertEqual(self.client.get_role(1), {"id": 1, "permissions": [1]})
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+    def test_parameterized_reads_are_keyed_by_params(self):
+        self.client.get_severities(params={"page": 1})
+        self.client.get_severities(params={"page": 1})
+        self.client.get_severities(params={"page": 2})
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_cache_disabled(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t", cache_ttl=0)
+        client.session = self.client.session
+        client.get_version()
+        client.get_version()
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_writes_invalidate_cache(self):
+        self.client.get_cefs()
+        self.client.session.delete.return_value.status_code = 204
+        self.client.get_role(3)
+        self.client.delete_cef(4)
+        self.client.get_cefs()
+        self.client.get_role(3)
+        self.assertEqual(self.client.session.get.call_count, 3)
+
+class TestPaginate(unittest.TestCase):
+    @patch("splunk_soar_rest._has_module", return_value=False)
+    def test_iter_containers_without_ijson(self, mock_has_module):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        client._handle_response = MagicMock(side_effect=[{"num_pages": 2, "data": [{"id": 1}]}, {"num_pages": 2, "data": [{"id": 2}]}])
+        self.assertEqual([c["id"] for c in client.iter_containers(page_size=1)], [1, 2])
+
+    def test_paginate_follows_num_pages(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        pages = [{"num_pages": 2, "data": [{"id": 1}, {"id": 2}]}, {"num_pages": 2, "data": [{"id": 3}]}]
+        client._handle_response = MagicMock(side_effect=pages)
+        items = list(client.paginate("artifact", params={"_filter_container_id": 5, "page": 0}, page_size=2))
+        self.assertEqual([i["id"] for i in items], [1, 2, 3])
+        urls = [c[0][0] for c in client.session.get.call_args_list]
+        self.assertEqual(urls, ["https://soar/rest/artifact?_filter_container_id=5&page_size=2&page=0",
+                                "https://soar/rest/artifact?_filter_container_id=5&page_size=2&page=1"])
+
+    def test_paginate_drops_none_params_and_coerces_page(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        client._handle_response = MagicMock(side_effect=[{"num_pages": 3, "data": [{"id": 2}]}, {"num_pages": 3, "data": [{"id": 3}]}])
+        items = list(client.paginate("container", params={"_filter_x": None, "status": "new", "page": "1"}, page_size=1))
+        self.assertEqual([i["id"] for i in items], [2, 3])
+        urls = [c[0][0] for c in client.session.get.call_args_list]
+        self.assertEqual(urls, ["https://soar/rest/container?status=new&page_size=1&page=1",
+                                "https://soar/rest/container?status=new&page_size=1&page=2"])
+
+    @patch("splunk_soar_rest._has_module", return_value=False)
+    def test_iter_search_without_num_pages_stops_on_short_page(self, mock_has_module):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        pages = [{"results": [{"id": 1}, {"id": 2}]}, {"results": [{"id": 3}]}]
+        client._handle_response = MagicMock(side_effect=pages)
+        self.assertEqual([r["id"] for r in client.iter_search("evil.com", page_size=2)], [1, 2, 3])
+        self.assertEqual(client.session.get.call_count, 2)
+
+    @patch("splunk_soar_rest._has_module", return_value=False)
+    def test_iter_search_uses_results_key(self, mock_has_module):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client.session = MagicMock()
+        client._handle_response = MagicMock(return_value={"num_pages": 1, "results": [{"id": "hit"}]})
+        self.assertEqual(list(client.iter_search("evil.com", categories="artifact")), [{"id": "hit"}])
+        client.session.get.assert_called_once_with("https://soar/rest/search?query=evil.com&categories=artifact&page_size=500&page=0")
+
+class TestWaitForRun(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+
+    @patch("splunk_soar_rest.time.sleep")
+    def test_wait_for_playbook_run_backs_off(self, mock_sleep):
+        self.client.get_playbook_run = MagicMock(side_effect=[{"status": "running"}] * 3 + [{"status": "success"}])
+        run = self.client.wait_for_playbook_run(9, initial_interval=1, max_interval=3)
+        self.assertEqual(run["status"], "success")
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1, 2, 3])
+
+    @patch("splunk_soar_rest.time.sleep")
+    @patch("splunk_soar_rest.time.monotonic", side_effect=[0, 5, 11])
+    def test_wait_for_action_run_timeout(self, mock_monotonic, mock_sleep):
+        self.client.get_action_run = MagicMock(return_value={"status": "running"})
+        with self.assertRaises(TimeoutError):
+            self.client.wait_for_action_run(3, timeout=10, initial_interval=1)
+        mock_sleep.assert_called_once_with(1)
+
+    def test_wait_rejects_non_positive_intervals(self):
+        self.client.get_playbook_run = MagicMock(return_value={"status": "running"})
+        with self.assertRaises(ValueError):
+            self.client.wait_for_playbook_run(9, initial_interval=0)
+        with self.assertRaises(ValueError):
+            self.client.wait_for_action_run(9, max_interval=-1)
+        self.client.get_playbook_run.assert_not_called()
+
+class TestBulkArtifacts(unittest.TestCase):
+    def test_create_artifacts_bulk_preserves_order(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client._post = MagicMock(side_effect=lambda endpoint, json_data=None: {"id": json_data["name"]})
+        results = client.create_artifacts_bulk([{"name": n} for n in "abcd"], max_workers=3)
+        self.assertEqual([r["id"] for r in results], list("abcd"))
+        self.assertEqual(client._post.call_count, 4)
+
+    def test_create_artifacts_single_request(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client._post = MagicMock(return_value=[{"id": 1}, {"id": 2}])
+        client.create_artifacts(({"name": "a"}, {"name": "b"}))
+        client._post.assert_called_once_with("artifact", json_data=[{"name": "a"}, {"name": "b"}])
+
+    def test_create_artifacts_streams_generators(self):
+        client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        client._post_body = MagicMock(return_value=[])
+        client.create_artifacts({"name": str(i)} for i in range(3))
+        endpoint, body = client._post_body.call_args[0]
+        self.assertEqual(endpoint, "artifact")
+        self.assertEqual(json.loads(b"".join(body)), [{"name": "0"}, {"name": "1"}, {"name": "2"}])
+
+    def test_iter_json_array_chunks(self):
+        chunks = list(splunk_soar_rest._iter_json_array(({"i": i} for i in range(50)), chunk_size=64))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json.loads(b"".join(chunks)), [{"i": i} for i in range(50)])
+        self.assertEqual(b"".join(splunk_soar_rest._iter_json_array([])), b"[]")
+
+class TestBulkCalls(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.client._get = MagicMock(side_effect=lambda endpoint, params=None: {"get": endpoint})
+        self.client._post = MagicMock(side_effect=lambda endpoint, json_data=None: {"post": endpoint})
+        self.client._delete = MagicMock(side_effect=lambda endpoint: None)
+
+    def test_results_follow_call_order(self):
+        calls = [("get", f"container/{i}", None) for i in range(6)]
+        calls += [("post", "artifact/1", {"name": "a"}), ("delete", "artifact/2", None)]
+        results = self.client.bulk(calls, max_workers=4)
+        self.assertEqual(results, [{"get": f"container/{i}"} for i in range(6)] + [{"post": "artifact/1"}, None])
+        self.client._post.assert_called_once_with("artifact/1", json_data={"name": "a"})
+        self.client._delete.assert_called_once_with("artifact/2")
+
+    def test_return_exceptions(self):
+        error = SplunkSOARError("API call failed", 404, "missing")
+
+        def get(endpoint, params=None):
+            if endpoint == "container/2":
+                raise error
+            return {"id": 1}
+        self.client._get.side_effect = get
+        results = self.client.bulk([("get", "container/1", None), ("get", "container/2", None)], return_exceptions=True)
+        self.assertEqual(results, [{"id": 1}, error])
+        with self.assertRaises(SplunkSOARError):
+            self.client.bulk([("get", "container/2", None)])
+
+    def test_unsupported_method_rejected_before_any_call(self):
+        calls = [("post", "artifact", {"name": "a"}), ("delete", "artifact/1", None), ("put", "container/1", {})]
+        with self.assertRaisesRegex(ValueError, "'put'"):
+            self.client.bulk(calls)
+        self.client._post.assert_not_called()
+        self.client._delete.assert_not_called()
+
+class TestWorkbookTemplateTree(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.phases = [{"name": "p1", "order": 1, "tasks": [{"name": "t1", "order": 1}, {"name": "t2", "order": 2}]},
+                       {"name": "p2", "order": 2}]
+
+    def test_nested_single_request(self):
+        self.client._post = MagicMock(return_value={"id": 5})
+        self.client.create_workbook_template_tree(self.phases, name="wb")
+        self.client._post.assert_called_once_with("workbook_template", json_data={"name": "wb", "phases": self.phases})
+
+    def test_fallback_creates_each_level(self):
+        ids = iter(range(10, 20))
+        self.client._post = MagicMock(side_effect=lambda endpoint, json_data=None: {"id": next(ids)})
+        template = self.client.create_workbook_template_tree(self.phases, nested=False, name="wb")
+        self.assertEqual(template, {"id": 10})
+        calls = [(c[0][0], c[1]["json_data"]) for c in self.client._post.call_args_list]
+        self.assertEqual(calls[1], ("workbook_phase_template", {"template": 10, "name": "p1", "order": 1}))
+        tasks = sorted((d for e, d in calls if e == "workbook_task_template"), key=lambda d: d["order"])
+        self.assertEqual(tasks, [{"name": "t1", "order": 1, "phase": 11}, {"name": "t2", "order": 2, "phase": 11}])
+
+class TestPlaybookDownload(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.client.session = MagicMock()
+        self.response = self.client.session.get.return_value.__enter__.return_value
+
+    def test_download_playbook_streams_chunks(self):
+        self.response.ok = True
+        self.response.iter_content.return_value = [b"ab", b"cd"]
+        buf = io.BytesIO()
+        self.client.download_playbook(7, buf, chunk_size=2)
+        self.assertEqual(buf.getvalue(), b"abcd")
+        self.client.session.get.assert_called_with("https://soar/rest/playbook/7", stream=True)
+        self.response.iter_content.assert_called_with(chunk_size=2)
+
+    def test_download_playbook_error(self):
+        self.response.ok = False
+        self.response.status_code = 404
+        self.response.text = "missing"
+        with self.assertRaises(SplunkSOARError):
+            self.client.download_playbook(7, io.BytesIO())
+
+@unittest.skipIf(not splunk_soar_rest._has_module("ijson"), "ijson is not installed")
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.client.session = MagicMock()
+        self.response = self.client.session.get.return_value.__enter__.return_value
+        self.response.ok = True
+
+    def test_iter_artifacts_yields_records(self):
+        self.response.raw = io.BytesIO(b'{"count": 2, "num_pages": 1, "data": [{"id": 1}, {"id": 2}]}')
+        items = list(self.client.iter_artifacts(params={"_filter_container_id": 3}, page_size=5))
+        self.assertEqual(items, [{"id": 1}, {"id": 2}])
+        self.client.session.get.assert_called_once_with(
+            "https://soar/rest/artifact?_filter_container_id=3&page_size=5&page=0", params=None, stream=True)
+
+    def test_paginate_stream_stops_on_short_page(self):
+        pages = [b'{"data": [{"id": 1}, {"id": 2}]}', b'{"data": [{"id": 3}]}']
+        self.client.session.get.return_value.__enter__.side_effect = lambda: MagicMock(ok=True, raw=io.BytesIO(pages.pop(0)))
+        items = list(self.client.paginate("container", page_size=2, stream=True))
+        self.assertEqual([i["id"] for i in items], [1, 2, 3])
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_paginate_stream_follows_num_pages(self):
+        pages = [b'{"num_pages": 3, "data": [{"id": 0}]}', b'{"num_pages": 3, "data": [{"id": 1, "tags": ["a"]}]}',
+                 b'{"num_pages": 3, "data": [{"id": 2}]}']
+        self.client.session.get.return_value.__enter__.side_effect = lambda: MagicMock(ok=True, raw=io.BytesIO(pages.pop(0)))
+        items = list(self.client.paginate("container", page_size=2, stream=True))
+        self.assertEqual(items, [{"id": 0}, {"id": 1, "tags": ["a"]}, {"id": 2}])
+        self.assertEqual(self.client.session.get.call_count, 3)
+
+    def test_paginate_stream_stops_at_last_full_page(self):
+        self.response.raw = io.BytesIO(b'{"num_pages": 1, "data": [{"id": 1}, {"id": 2}]}')
+        self.assertEqual(len(list(self.client.paginate("container", page_size=2, stream=True))), 2)
+        self.assertEqual(self.client.session.get.call_count, 1)
+
+    def test_get_audit_events_stream(self):
+        self.response.raw = io.BytesIO(b'{"data": [{"id": 4}]}')
+        self.assertEqual(list(self.client.get_audit_events(stream=True)), [{"id": 4}])
+        self.client.session.get.assert_called_with("https://soar/rest/audit", params=None, stream=True)
+
+    def test_iter_containers_error(self):
+        self.response.ok = False
+        self.response.status_code = 401
+        with self.assertRaises(SplunkSOARError):
+            list(self.client.iter_containers())
+
+class TestFileUploads(unittest.TestCase):
+    def setUp(self):
+        self.client = SplunkSOARClient(base_url="https://soar", auth_token="t")
+        self.client.session = MagicMock()
+        self.client.session.post.return_value.ok = True
+        self.client.session.post.return_value.status_code = 204
+        tmp = tempfile.NamedTemporaryFile(delete=False)
+        tmp.write(b"\x00\x01payload" * 1000)
+        tmp.close()
+        self.path = tmp.name
+        self.addCleanup(os.unlink, self.path)
+
+    def test_attachment_body_is_streamed_json(self):
+        self.client.add_container_attachment_from_path(3, self.path, "a.bin")
+        args, kwargs = self.client.session.post.call_args
+        self.assertEqual(args[0], "https://soar/rest/container_attachment")
+        body = kwargs["data"]
+        raw = b"".join(body)
+        self.assertEqual(len(raw), len(body))
+        data = json.loads(raw)
+        self.assertEqual(base64.b64decode(data["file_content"]), b"\x00\x01payload" * 1000)
+        self.assertEqual(data["container_id"], 3)
+        self.assertEqual(data["metadata"], {"contains": ["vault id"]})
+
+    def test_failed_post_leaves_no_open_file(self):
+        self.client.session.post.side_effect = ConnectionError("refused")
+        with patch("splunk_soar_rest.open", create=True, wraps=open) as mock_open:
+            with self.assertRaises(ConnectionError):
+                self.client.install_app_from_path(self.path)
+            with self.assertRaises(ConnectionError):
+                self.client.add_container_attachment_from_path(3, self.path, "a.bin")
+        mock_open.assert_not_called()
+
+    def test_missing_file_fails_before_request(self):
+        with self.assertRaises(FileNotFoundError):
+            self.client.import_playbook_from_path(self.path + ".missing")
+        self.client.session.post.assert_not_called()
+
+    def test_import_playbook_body(self):
+        self.client.import_playbook_from_path(self.path, force=True)
+        args, kwargs = self.client.session.post.call_args
+        self.assertEqual(args[0], "https://soar/rest/import_playbook")
+        data = json.loads(b"".join(kwargs["data"]))
+        self.assertEqual((data["scm"], data["force"]), ("local", True))
+        self.assertEqual(base64.b64decode(data["playbook"]), b"\x00\x01payload" * 1000)
+
 class TestEndToEnd(unittest.TestCase):
     @classmethod
     def setUpClass(cls):